@@ -1,5 +1,15 @@
+import subprocess
+
 import PyInstaller.__main__
 
+# Compile the Qt resource file into src/resources_rc.py so stylesheets load
+# from memory at runtime. Config and icons are still read from disk through
+# ResourceManager, so the resources tree must keep shipping via --add-data.
+subprocess.run(
+    ['pyrcc5', 'resources/resources.qrc', '-o', 'src/resources_rc.py'],
+    check=True
+)
+
 PyInstaller.__main__.run([
     'src/main.py',
     '--onefile',
@@ -7,6 +17,8 @@ PyInstaller.__main__.run([
     '--name=ExcelProcessor',
     '--icon=resources/icons/app_icon.png',
     '--add-data=resources;resources',
+    '--exclude-module=numpy.tests',
+    '--exclude-module=PyQt5.QtBluetooth',
     '--distpath=dist',
     '--workpath=build',
     '--clean'
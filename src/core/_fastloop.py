@@ -0,0 +1,57 @@
+"""
+Excel File Processor - Compiled hot-loop helpers
+
+Numba-compiled helpers for the per-file progress accounting done by the
+background processing thread. Numba is optional: when it is not installed
+the functions run as plain Python so the application still works without
+the JIT toolchain.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # No-op fallback decorator used when numba is unavailable
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def compute_progress(i, total, base, span):
+    """Map file index i of total onto the [base, base + span] progress range"""
+    return base + int((i + 1) / total * span)
+
+
+@njit(cache=True)
+def _all_positive(lengths):
+    for n in lengths:
+        if n <= 0:
+            return False
+    return True
+
+
+def batch_validate_paths(paths):
+    """Sanity-check a batch of file paths (no empty entries) in one pass"""
+    lengths = np.fromiter((len(p) for p in paths), dtype=np.int64, count=len(paths))
+    return _all_positive(lengths)
+
+
+def warm_jit():
+    """Compile (or load from the on-disk cache) every jitted helper
+
+    Called from a background thread at application launch so the first
+    processing run never pays the compile cost; cache=True persists the
+    compiled code across runs.
+    """
+    if NUMBA_AVAILABLE:
+        compute_progress(0, 1, 0, 20)
+        _all_positive(np.ones(1, dtype=np.int64))
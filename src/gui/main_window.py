@@ -25,24 +25,226 @@ to test the GUI layout and interactions.
 
 import sys
 import os
+import time
+import threading
+import subprocess
+import functools
+from collections import defaultdict
+from dataclasses import dataclass, fields
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QLabel, QLineEdit, QTextEdit, 
                              QFileDialog, QMessageBox, QProgressBar, QGroupBox,
                              QGridLayout, QFrame)
-from PyQt5.QtCore import Qt, QMimeData, QThread, pyqtSignal
-from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QFont, QPalette, QIcon, QPixmap
+from PyQt5.QtCore import (Qt, QMimeData, QFile, QObject, QRunnable,
+                          QThreadPool, QTimer, pyqtSignal)
+from PyQt5.QtGui import (QDragEnterEvent, QDropEvent, QFont, QPalette, QIcon,
+                         QPixmap, QPixmapCache)
 
-# Import project modules
-from core.excel_processor import ExcelProcessor  # TODO: Create this class
-from core.file_handler import FileHandler  # TODO: Create this class
-from utils.validators import FileValidator  # TODO: Create this class
+# Import project modules. ExcelProcessor, FileHandler, FileValidator and the
+# _fastloop helpers are imported lazily at first use: they drag in pandas,
+# openpyxl and the JIT toolchain, which would otherwise dominate cold-start
+# time under PyInstaller --onefile.
 from utils.logger import setup_logger  # TODO: Create this function
 from utils.resource_manager import ResourceManager  # TODO: Create this class
 
+# Compiled Qt resources (generated from resources/resources.qrc by build.py).
+# When present, stylesheets and icons are served from memory via ":/..."
+# paths; during development the on-disk files are used instead.
+try:
+    import resources_rc  # noqa: F401
+    _HAVE_QRC = True
+except ImportError:
+    _HAVE_QRC = False
+
+# Shared ResourceManager with memoized accessors: widget construction looks
+# up the same config keys and stylesheets dozens of times, so repeated calls
+# should hit an in-memory cache instead of re-reading app_config.json and
+# .qss files from disk on the UI thread.
+_resource_manager = ResourceManager()
+
+
+@functools.lru_cache(maxsize=None)
+def _cfg(key, default=None):
+    return _resource_manager.get_config(key, default)
+
+
+@functools.lru_cache(maxsize=None)
+def _qss(name):
+    if _HAVE_QRC:
+        qss_file = QFile(f":/styles/{name}")
+        if qss_file.open(QFile.ReadOnly | QFile.Text):
+            try:
+                return bytes(qss_file.readAll()).decode("utf-8")
+            finally:
+                qss_file.close()
+    return _resource_manager.get_stylesheet(name)
+
+
+def _icon(name):
+    """Fetch an icon through QPixmapCache so each PNG is decoded only once"""
+    pixmap = QPixmap()
+    if QPixmapCache.find(name, pixmap):
+        return pixmap
+    pixmap = _resource_manager.get_icon(name)
+    if pixmap:
+        QPixmapCache.insert(name, pixmap)
+    return pixmap
+
+
+@functools.lru_cache(maxsize=None)
+def _validator():
+    """Import FileValidator on first use, keeping it off the startup path"""
+    from utils.validators import FileValidator  # TODO: Create this class
+    return FileValidator
+
+
+def _prewarm_numba():
+    """Import _fastloop and compile its JIT helpers off the GUI thread
+
+    A broken or missing JIT toolchain makes this a no-op; the processing
+    path falls back to the plain-Python helpers either way.
+    """
+    try:
+        from core._fastloop import warm_jit
+    except ImportError:
+        return
+    warm_jit()
+
+
+# Recognized Excel extensions; frozenset membership is one hash probe per
+# candidate instead of per-call tuple scans and string suffix allocations
+_EXCEL_EXT = frozenset({'.xlsx', '.xls'})
+
+
+def _looks_like_excel(path):
+    """Cheap extension fast-path checked before the full file validator"""
+    return os.path.splitext(path)[1].lower() in _EXCEL_EXT
+
+
+class _LazyBasenames:
+    """Defers basename extraction for log lines until a handler emits them"""
+
+    __slots__ = ("paths",)
+
+    def __init__(self, paths):
+        self.paths = paths
+
+    def __str__(self):
+        return str(_basenames(self.paths))
+
+
+def _basenames(paths, _sep=os.sep, _altsep=os.altsep):
+    """Strip directories from a batch of paths with one C-level call each
+
+    Cheaper than os.path.basename in a loop, which goes through
+    ntpath/posixpath splitting machinery per path.
+    """
+    if _altsep:
+        paths = [p.rpartition(_altsep)[2] or p for p in paths]
+    return [p.rpartition(_sep)[2] or p for p in paths]
+
+
+class FileValidationSignals(QObject):
+    """Signals for FileValidationTask (QRunnable cannot emit signals itself)"""
+    finished = pyqtSignal(list, list)  # valid file paths, invalid file names
+
+
+class FileValidationTask(QRunnable):
+    """Validates candidate Excel files on a pool thread
+
+    FileValidator.is_valid_excel_file does filesystem I/O per file, so
+    running it for hundreds of dropped files would freeze the GUI thread.
+    """
+
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+        self.signals = FileValidationSignals()
+
+    def run(self):
+        # Group paths by parent directory and scandir each one once, so
+        # classification runs against an in-memory entry table: one syscall
+        # per directory instead of one stat per file, which matters on
+        # network drives.
+        by_dir = defaultdict(list)
+        for file_path in self.paths:
+            directory, name = os.path.split(file_path)
+            by_dir[directory or "."].append((file_path, name))
+
+        valid_files = []
+        invalid_paths = []
+
+        for directory, candidates in by_dir.items():
+            try:
+                entries = {e.name: e for e in os.scandir(directory)}
+            except OSError:
+                invalid_paths.extend(path for path, _ in candidates)
+                continue
+
+            for file_path, name in candidates:
+                entry = entries.get(name)
+                # TODO: Use FileValidator.is_valid_excel_file(file_path)
+                if (entry is not None and entry.is_file()
+                        and _looks_like_excel(name)
+                        and _validator().is_valid_excel_file(file_path)):
+                    valid_files.append(file_path)
+                else:
+                    invalid_paths.append(file_path)
+
+        self.signals.finished.emit(valid_files, _basenames(invalid_paths))
+
+
+class OpenFileSignals(QObject):
+    """Signals for OpenFileTask"""
+    error = pyqtSignal(str)
+
+
+class OpenFileTask(QRunnable):
+    """Opens a file with the platform handler on a pool thread
+
+    ShellExecute/xdg-open can block for hundreds of milliseconds while the
+    OS resolves file associations, which would freeze the GUI in a slot.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = OpenFileSignals()
+
+    def run(self):
+        try:
+            if sys.platform.startswith('win'):
+                os.startfile(self.path)
+            elif sys.platform == 'darwin':
+                subprocess.Popen(['open', self.path], start_new_session=True)
+            else:
+                subprocess.Popen(['xdg-open', self.path], start_new_session=True)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
 
 class FileDropArea(QFrame):
     """Custom widget for drag and drop file functionality"""
     files_dropped = pyqtSignal(list)
+
+    # Fallback inline styles used when drop_area.qss cannot be loaded. The
+    # [dragActive="true"] selector lets drag feedback toggle via a dynamic
+    # property instead of re-parsing a new stylesheet per drag event.
+    FALLBACK_QSS = """
+        FileDropArea {
+            border: 2px dashed #aaa;
+            border-radius: 10px;
+            background-color: #f9f9f9;
+        }
+        FileDropArea:hover {
+            border-color: #2196F3;
+            background-color: #e3f2fd;
+        }
+        FileDropArea[dragActive="true"] {
+            border: 2px dashed #2196F3;
+            background-color: #e3f2fd;
+        }
+    """
     
     def __init__(self):
         super().__init__()
@@ -52,8 +254,13 @@ class FileDropArea(QFrame):
         self.setLineWidth(2)
         
         # TODO: Initialize ResourceManager for accessing styles and icons
-        self.resource_manager = ResourceManager()
-        
+        self.resource_manager = _resource_manager
+
+        # One reusable warning dialog; constructing a native message box per
+        # warning pays the platform dialog setup cost every time
+        self._warning_box = QMessageBox(QMessageBox.Warning, "", "",
+                                        QMessageBox.Ok, self)
+
         self.setup_ui()
         self.load_styles()
         
@@ -65,7 +272,7 @@ class FileDropArea(QFrame):
         
         # TODO: Add icon from resources/icons/upload.png
         upload_icon = QLabel()
-        upload_pixmap = self.resource_manager.get_icon("upload.png")  # TODO: Create upload.png icon
+        upload_pixmap = _icon("upload.png")  # TODO: Create upload.png icon
         if upload_pixmap:
             upload_icon.setPixmap(upload_pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation))
         
@@ -73,7 +280,7 @@ class FileDropArea(QFrame):
         self.main_label.setAlignment(Qt.AlignCenter)
         
         # TODO: Get font settings from resources/config/app_config.json
-        font_config = self.resource_manager.get_config("fonts.main_label")  # TODO: Create app_config.json
+        font_config = _cfg("fonts.main_label")  # TODO: Create app_config.json
         font = QFont()
         font.setPointSize(font_config.get("size", 12))
         font.setBold(font_config.get("bold", False))
@@ -86,7 +293,7 @@ class FileDropArea(QFrame):
         # Browse button with icon
         self.browse_btn = QPushButton("Browse Files")
         # TODO: Add icon from resources/icons/folder.png
-        folder_icon = self.resource_manager.get_icon("folder.png")  # TODO: Create folder.png icon
+        folder_icon = _icon("folder.png")  # TODO: Create folder.png icon
         if folder_icon:
             self.browse_btn.setIcon(QIcon(folder_icon))
         
@@ -97,7 +304,7 @@ class FileDropArea(QFrame):
         self.file_list = QTextEdit()
         self.file_list.setMaximumHeight(80)
         # TODO: Get placeholder text from resources/config/app_config.json
-        placeholder_text = self.resource_manager.get_config("ui.placeholders.file_list", "Selected files will appear here...")
+        placeholder_text = _cfg("ui.placeholders.file_list", "Selected files will appear here...")
         self.file_list.setPlaceholderText(placeholder_text)
         self.file_list.setReadOnly(True)
         
@@ -109,188 +316,199 @@ class FileDropArea(QFrame):
         self.setLayout(layout)
     
     def load_styles(self):
-        """Load stylesheet from external file"""
+        """Install the stylesheet once; drag feedback toggles a property"""
         # TODO: Load stylesheet from resources/styles/drop_area.qss
-        stylesheet = self.resource_manager.get_stylesheet("drop_area.qss")
-        if stylesheet:
-            self.setStyleSheet(stylesheet)
-        else:
-            # Fallback inline styles (temporary)
-            self.setStyleSheet("""
-                FileDropArea {
-                    border: 2px dashed #aaa;
-                    border-radius: 10px;
-                    background-color: #f9f9f9;
-                }
-                FileDropArea:hover {
-                    border-color: #2196F3;
-                    background-color: #e3f2fd;
-                }
-            """)
-    
+        stylesheet = _qss("drop_area.qss")
+        self.setStyleSheet(stylesheet or self.FALLBACK_QSS)
+        self.setProperty("dragActive", False)
+
+    def _set_drag_active(self, active):
+        """Toggle the dragActive property and re-polish, without re-parsing QSS"""
+        if self.property("dragActive") == active:
+            return
+        self.setProperty("dragActive", active)
+        self.style().unpolish(self)
+        self.style().polish(self)
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
-            # TODO: Load drag-active stylesheet from resources/styles/drop_area_active.qss
-            active_stylesheet = self.resource_manager.get_stylesheet("drop_area_active.qss")
-            if active_stylesheet:
-                self.setStyleSheet(active_stylesheet)
-            else:
-                # Fallback inline style
-                self.setStyleSheet("""
-                    FileDropArea {
-                        border: 2px dashed #2196F3;
-                        border-radius: 10px;
-                        background-color: #e3f2fd;
-                    }
-                """)
-    
+            self._set_drag_active(True)
+
     def dragLeaveEvent(self, event):
-        # TODO: Reload normal stylesheet
-        self.load_styles()
+        self._set_drag_active(False)
     
     def dropEvent(self, event: QDropEvent):
-        files = []
-        invalid_files = []
-        
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            # TODO: Use FileValidator.is_valid_excel_file(file_path)
-            if FileValidator.is_valid_excel_file(file_path):
-                files.append(file_path)
-            else:
-                invalid_files.append(os.path.basename(file_path))
-        
-        if files:
-            self.files_dropped.emit(files)
-            self.update_file_list(files)
-            
-            if invalid_files:
-                QMessageBox.warning(
-                    self, 
-                    "Some Invalid Files", 
-                    f"The following files were skipped (not valid Excel files):\n" + 
-                    "\n".join(invalid_files)
-                )
-        else:
-            QMessageBox.warning(self, "Invalid Files", 
-                              "Please drop only valid Excel files (.xls, .xlsx)")
-        
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        self._start_validation(paths)
+
         # Reset style
         self.dragLeaveEvent(None)
-    
+
     def browse_files(self):
         files, _ = QFileDialog.getOpenFileNames(
-            self, 
+            self,
             "Select Excel Files",
             "",
             "Excel Files (*.xlsx *.xls);;All Files (*)"
         )
-        
+
         if files:
-            # TODO: Use FileValidator to validate selected files
-            valid_files = []
-            invalid_files = []
-            
-            for file_path in files:
-                if FileValidator.is_valid_excel_file(file_path):
-                    valid_files.append(file_path)
-                else:
-                    invalid_files.append(os.path.basename(file_path))
-            
-            if valid_files:
-                self.files_dropped.emit(valid_files)
-                self.update_file_list(valid_files)
-                
-                if invalid_files:
-                    QMessageBox.warning(
-                        self, 
-                        "Some Invalid Files", 
-                        f"The following files were skipped:\n" + 
-                        "\n".join(invalid_files)
-                    )
-            else:
-                QMessageBox.warning(self, "No Valid Files", 
-                                  "No valid Excel files were selected.")
+            self._start_validation(files)
+
+    def _start_validation(self, paths):
+        """Validate the selected paths on a pool thread, not the GUI thread"""
+        # Drop duplicate selections up front (order-preserving) so the same
+        # file is never validated, loaded and processed twice
+        paths = list(dict.fromkeys(paths))
+        self.setEnabled(False)
+        self._validation_task = FileValidationTask(paths)
+        self._validation_task.signals.finished.connect(self._on_validation_finished)
+        QThreadPool.globalInstance().start(self._validation_task)
+
+    def _warn(self, title, text):
+        """Show the pooled warning dialog with the given title and text"""
+        self._warning_box.setWindowTitle(title)
+        self._warning_box.setText(text)
+        self._warning_box.exec_()
+
+    def _on_validation_finished(self, valid_files, invalid_files):
+        self.setEnabled(True)
+
+        if valid_files:
+            self.files_dropped.emit(valid_files)
+            self.update_file_list(valid_files)
+
+            if invalid_files:
+                self._warn(
+                    "Some Invalid Files",
+                    "The following files were skipped (not valid Excel files):\n" +
+                    "\n".join(invalid_files)
+                )
+        else:
+            self._warn("Invalid Files",
+                       "Please select only valid Excel files (.xls, .xlsx)")
     
     def update_file_list(self, files):
-        file_names = [os.path.basename(f) for f in files]
-        self.file_list.setText('\n'.join(file_names))
+        self.file_list.setText('\n'.join(_basenames(files)))
+
 
+@dataclass(frozen=True, slots=True)
+class ConfigValues:
+    """Configuration field values captured from the UI
 
-class ProcessingThread(QThread):
-    """Background thread for processing files"""
+    Frozen and slotted so the processing path uses fixed-offset attribute
+    access instead of per-key dict hashing, and so the values cannot be
+    mutated while the background thread is running.
+    """
+    project_name: str = ""
+    department: str = ""
+    analyst: str = ""
+    report_date: str = ""
+    version: str = ""
+
+
+# Field labels are config-driven (ui.input_fields.labels), so the UI can
+# produce keys ConfigValues does not declare; those are dropped with a
+# warning instead of raising TypeError on the Process click.
+_CONFIG_VALUE_KEYS = frozenset(f.name for f in fields(ConfigValues))
+
+
+class WorkerSignals(QObject):
+    """Signals for ProcessingWorker"""
     progress_updated = pyqtSignal(int)
     processing_complete = pyqtSignal(str)  # Success message
     processing_error = pyqtSignal(str)     # Error message
-    
+
+
+class ProcessingWorker(QRunnable):
+    """Background worker for processing files
+
+    Runs on the global QThreadPool so repeated processing runs reuse a warm
+    pool thread instead of paying QThread spawn/teardown each time.
+    """
+
     def __init__(self, input_files, string_values, output_path):
         super().__init__()
+        self.signals = WorkerSignals()
         self.input_files = input_files
         self.string_values = string_values
         self.output_path = output_path
         self.logger = setup_logger(__name__)  # TODO: Implement setup_logger function
-    
+        self._last_pct = -1
+        self._last_emit = time.monotonic()
+
+    def _emit_progress(self, progress):
+        """Emit progress_updated, coalescing redundant or too-frequent updates
+
+        Only integer-percentage transitions are sent, and at most one every
+        50ms (except the final 100%), so the GUI thread is not flooded with
+        repaint requests when processing hundreds of files.
+        """
+        now = time.monotonic()
+        if progress == self._last_pct:
+            return
+        if progress < 100 and (now - self._last_emit) < 0.05:
+            return
+        self._last_pct = progress
+        self._last_emit = now
+        self.signals.progress_updated.emit(progress)
+
     def run(self):
         try:
-            self.logger.info(f"Starting processing of {len(self.input_files)} files")  # TODO: Logger
+            # Deferred heavy imports (pandas/openpyxl/JIT) - see module header
+            from core.excel_processor import ExcelProcessor  # TODO: Create this class
+            from core.file_handler import FileHandler  # TODO: Create this class
+            from core._fastloop import compute_progress, batch_validate_paths
+
+            self.logger.info("Starting processing of %d files", len(self.input_files))  # TODO: Logger
             
             # TODO: Initialize FileHandler and ExcelProcessor
             file_handler = FileHandler()
             excel_processor = ExcelProcessor()
             
-            # TODO: Validate all input files before processing
+            # Batch sanity-check the whole path list in one compiled pass
+            if not batch_validate_paths(self.input_files):
+                raise Exception("Input file list contains an empty path")
+
+            # Fused per-file pass: validate, load and process each workbook
+            # before touching the next one (0-85% of the progress range).
+            # Peak memory stays at one loaded workbook instead of all of
+            # them, and the path list is walked once instead of three times.
             total_files = len(self.input_files)
             for i, file_path in enumerate(self.input_files):
-                self.logger.info(f"Validating file: {file_path}")  # TODO: Logger
-                
+                self.logger.info("Processing file: %s", file_path)  # TODO: Logger
+
                 # TODO: Use FileValidator.validate_file_accessibility(file_path)
-                if not FileValidator.validate_file_accessibility(file_path):
+                if not _validator().validate_file_accessibility(file_path):
                     raise Exception(f"Cannot access file: {file_path}")
-                
-                # Update progress for validation phase (0-20%)
-                progress = int((i + 1) / total_files * 20)
-                self.progress_updated.emit(progress)
-            
-            # TODO: Load and process files using ExcelProcessor
-            self.logger.info("Loading input files...")  # TODO: Logger
-            loaded_data = []
-            
-            for i, file_path in enumerate(self.input_files):
-                self.logger.info(f"Loading file: {file_path}")  # TODO: Logger
-                
+
                 # TODO: Use FileHandler.load_excel_file(file_path)
                 file_data = file_handler.load_excel_file(file_path)
-                loaded_data.append(file_data)
-                
-                # Update progress for loading phase (20-60%)
-                progress = 20 + int((i + 1) / total_files * 40)
-                self.progress_updated.emit(progress)
-            
-            # TODO: Process data using ExcelProcessor
-            self.logger.info("Processing data...")  # TODO: Logger
-            self.progress_updated.emit(70)
-            
-            # TODO: Use ExcelProcessor.process_files(loaded_data, self.string_values)
-            processed_data = excel_processor.process_files(loaded_data, self.string_values)
-            
-            self.progress_updated.emit(85)
-            
+
+                # TODO: Use ExcelProcessor.process_one(file_data, self.string_values)
+                excel_processor.process_one(file_data, self.string_values)
+
+                self._emit_progress(compute_progress(i, total_files, 0, 85))
+
+            # TODO: Use ExcelProcessor.finalize() to collect the accumulated result
+            processed_data = excel_processor.finalize()
+
             # TODO: Save output using FileHandler
-            self.logger.info(f"Saving output to: {self.output_path}")  # TODO: Logger
+            self.logger.info("Saving output to: %s", self.output_path)  # TODO: Logger
             
             # TODO: Use FileHandler.save_excel_file(processed_data, self.output_path)
             file_handler.save_excel_file(processed_data, self.output_path)
             
-            self.progress_updated.emit(100)
+            self._emit_progress(100)
             
             self.logger.info("Processing completed successfully")  # TODO: Logger
-            self.processing_complete.emit(f"Successfully processed {total_files} files and saved to {os.path.basename(self.output_path)}!")
+            self.signals.processing_complete.emit(f"Successfully processed {total_files} files and saved to {os.path.basename(self.output_path)}!")
             
         except Exception as e:
             error_msg = f"Error during processing: {str(e)}"
             self.logger.error(error_msg)  # TODO: Logger
-            self.processing_error.emit(error_msg)
+            self.signals.processing_error.emit(error_msg)
 
 
 class MainWindow(QMainWindow):
@@ -300,59 +518,67 @@ class MainWindow(QMainWindow):
         self.output_path = ""
         
         # TODO: Initialize ResourceManager and Logger
-        self.resource_manager = ResourceManager()
+        self.resource_manager = _resource_manager
         self.logger = setup_logger(__name__)  # TODO: Implement setup_logger function
         
         # TODO: Load window configuration from resources/config/app_config.json
-        window_config = self.resource_manager.get_config("window")
+        window_config = _cfg("window")
         
         self.setWindowTitle(window_config.get("title", "Excel File Processor"))
         min_size = window_config.get("min_size", {"width": 600, "height": 500})
         self.setMinimumSize(min_size["width"], min_size["height"])
         
         # TODO: Set application icon from resources/icons/app_icon.ico
-        app_icon = self.resource_manager.get_icon("app_icon.ico")
+        app_icon = _icon("app_icon.ico")
         if app_icon:
             self.setWindowIcon(QIcon(app_icon))
         
-        self.setup_ui()
+        # Build only the skeleton up front so the window paints immediately;
+        # the rest of the widgets are created once the event loop is running.
+        self._setup_skeleton()
         self.load_main_stylesheet()
-        
+        QTimer.singleShot(0, self._setup_deferred)
+
         self.logger.info("Application started")  # TODO: Logger
     
     def load_main_stylesheet(self):
         """Load main window stylesheet"""
         # TODO: Load main stylesheet from resources/styles/main_window.qss
-        main_stylesheet = self.resource_manager.get_stylesheet("main_window.qss")
+        main_stylesheet = _qss("main_window.qss")
         if main_stylesheet:
             self.setStyleSheet(main_stylesheet)
         
-    def setup_ui(self):
+    def _setup_skeleton(self):
+        """Create the minimal widgets needed for the first paint"""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
-        
-        main_layout = QVBoxLayout()
-        central_widget.setLayout(main_layout)
-        
+
+        self._main_layout = QVBoxLayout()
+        central_widget.setLayout(self._main_layout)
+
         # Title with styling from config
         # TODO: Get title configuration from resources/config/app_config.json
-        title_config = self.resource_manager.get_config("ui.title")
+        title_config = _cfg("ui.title")
         title_text = title_config.get("text", "Excel File Processor")
-        
+
         title = QLabel(title_text)
         title.setAlignment(Qt.AlignCenter)
         title.setObjectName("titleLabel")  # For CSS styling
-        
+
         # TODO: Apply title font from config
         font = QFont()
         font.setPointSize(title_config.get("font_size", 16))
         font.setBold(title_config.get("bold", True))
         title.setFont(font)
-        main_layout.addWidget(title)
-        
+        self._main_layout.addWidget(title)
+
+    def _setup_deferred(self):
+        """Build the remaining widget groups after the window is shown"""
+        main_layout = self._main_layout
+
         # File drop area
         # TODO: Get group box labels from resources/config/app_config.json
-        labels_config = self.resource_manager.get_config("ui.labels")
+        labels_config = _cfg("ui.labels")
         
         file_group = QGroupBox(labels_config.get("input_files", "Input Files"))
         file_group.setObjectName("inputFilesGroup")  # For CSS styling
@@ -369,10 +595,8 @@ class MainWindow(QMainWindow):
         string_group.setObjectName("configurationGroup")  # For CSS styling
         string_layout = QGridLayout()
         
-        self.string_fields = {}
-        
         # TODO: Get field labels from resources/config/app_config.json
-        field_config = self.resource_manager.get_config("ui.input_fields")
+        field_config = _cfg("ui.input_fields")
         field_labels = field_config.get("labels", [
             "Project Name:",
             "Department:",
@@ -380,26 +604,19 @@ class MainWindow(QMainWindow):
             "Report Date:",
             "Version:"
         ])
-        
-        for i, label in enumerate(field_labels):
-            label_widget = QLabel(label)
-            label_widget.setObjectName(f"fieldLabel{i}")  # For CSS styling
-            
-            line_edit = QLineEdit()
-            line_edit.setObjectName(f"fieldInput{i}")  # For CSS styling
-            
-            # TODO: Get placeholder text from config
-            field_key = label.replace(':', '').replace(' ', '_').lower()
-            placeholder_config = self.resource_manager.get_config(f"ui.placeholders.{field_key}")
-            placeholder_text = placeholder_config or f"Enter {label.replace(':', '').lower()}..."
-            line_edit.setPlaceholderText(placeholder_text)
-            
+
+        # One config lookup for all placeholders instead of one per field
+        placeholders = _cfg("ui.placeholders") or {}
+
+        fields = [self._make_field(i, label, placeholders)
+                  for i, label in enumerate(field_labels)]
+
+        self.string_fields = {}
+        for i, (field_key, label_widget, line_edit) in enumerate(fields):
             string_layout.addWidget(label_widget, i, 0)
             string_layout.addWidget(line_edit, i, 1)
-            
-            # Store reference to the field
             self.string_fields[field_key] = line_edit
-        
+
         string_group.setLayout(string_layout)
         main_layout.addWidget(string_group)
         
@@ -412,7 +629,7 @@ class MainWindow(QMainWindow):
         path_layout = QHBoxLayout()
         
         # TODO: Get default output messages from config
-        output_config = self.resource_manager.get_config("ui.output")
+        output_config = _cfg("ui.output")
         default_message = output_config.get("no_location_message", "No output location selected")
         
         self.output_path_label = QLabel(default_message)
@@ -423,7 +640,7 @@ class MainWindow(QMainWindow):
         self.save_as_btn.setObjectName("saveAsButton")  # For CSS styling
         
         # TODO: Add icon from resources/icons/save.png
-        save_icon = self.resource_manager.get_icon("save.png")
+        save_icon = _icon("save.png")
         if save_icon:
             self.save_as_btn.setIcon(QIcon(save_icon))
         
@@ -445,7 +662,7 @@ class MainWindow(QMainWindow):
         
         # Process button
         # TODO: Get button configuration from resources/config/app_config.json
-        button_config = self.resource_manager.get_config("ui.buttons.process")
+        button_config = _cfg("ui.buttons.process")
         
         self.process_btn = QPushButton(button_config.get("text", "Process Files"))
         self.process_btn.setObjectName("processButton")  # For CSS styling
@@ -453,7 +670,7 @@ class MainWindow(QMainWindow):
         self.process_btn.setEnabled(False)
         
         # TODO: Add icon from resources/icons/process.png
-        process_icon = self.resource_manager.get_icon("process.png")
+        process_icon = _icon("process.png")
         if process_icon:
             self.process_btn.setIcon(QIcon(process_icon))
         
@@ -462,13 +679,27 @@ class MainWindow(QMainWindow):
         
         # Status bar
         # TODO: Get status messages from resources/config/app_config.json
-        status_config = self.resource_manager.get_config("ui.status_messages")
+        status_config = _cfg("ui.status_messages")
         ready_message = status_config.get("ready", "Ready - Select input files and configure settings")
         self.statusBar().showMessage(ready_message)
     
+    def _make_field(self, index, label, placeholders):
+        """Build one configuration field row as (key, label widget, line edit)"""
+        label_widget = QLabel(label)
+        label_widget.setObjectName(f"fieldLabel{index}")  # For CSS styling
+
+        line_edit = QLineEdit()
+        line_edit.setObjectName(f"fieldInput{index}")  # For CSS styling
+
+        field_key = label.replace(':', '').replace(' ', '_').lower()
+        placeholder_text = placeholders.get(field_key) or f"Enter {label.replace(':', '').lower()}..."
+        line_edit.setPlaceholderText(placeholder_text)
+
+        return field_key, label_widget, line_edit
+
     def on_files_selected(self, files):
-        self.input_files = files
-        self.logger.info(f"Selected {len(files)} input files")  # TODO: Logger
+        self.input_files = list(dict.fromkeys(files))
+        self.logger.info("Selected %d input files", len(files))  # TODO: Logger
         self.update_process_button_state()
         self.statusBar().showMessage(f"Selected {len(files)} file(s)")
     
@@ -482,7 +713,7 @@ class MainWindow(QMainWindow):
         
         if file_path:
             # TODO: Use FileValidator.validate_output_path(file_path)
-            if not FileValidator.validate_output_path(file_path):
+            if not _validator().validate_output_path(file_path):
                 QMessageBox.warning(
                     self, 
                     "Invalid Output Path", 
@@ -493,7 +724,7 @@ class MainWindow(QMainWindow):
             self.output_path = file_path
             self.output_path_label.setText(os.path.basename(file_path))
             self.output_path_label.setStyleSheet("color: #000;")
-            self.logger.info(f"Output path set to: {file_path}")  # TODO: Logger
+            self.logger.info("Output path set to: %s", file_path)  # TODO: Logger
             self.update_process_button_state()
     
     def update_process_button_state(self):
@@ -503,7 +734,7 @@ class MainWindow(QMainWindow):
         
         if can_process:
             # TODO: Load active button stylesheet from resources/styles/buttons_active.qss
-            active_button_style = self.resource_manager.get_stylesheet("buttons_active.qss")
+            active_button_style = _qss("buttons_active.qss")
             if active_button_style:
                 self.process_btn.setStyleSheet(active_button_style)
             else:
@@ -522,18 +753,26 @@ class MainWindow(QMainWindow):
                 """)
         else:
             # TODO: Load disabled button stylesheet from resources/styles/buttons_disabled.qss
-            disabled_button_style = self.resource_manager.get_stylesheet("buttons_disabled.qss")
+            disabled_button_style = _qss("buttons_disabled.qss")
             if disabled_button_style:
                 self.process_btn.setStyleSheet(disabled_button_style)
             else:
                 self.process_btn.setStyleSheet("")  # Reset to default
     
     def get_string_values(self):
-        """Get all string field values as a dictionary"""
-        values = {}
-        for key, field in self.string_fields.items():
-            values[key] = field.text().strip()
-        return values
+        """Get all string field values as a ConfigValues instance
+
+        Fields whose keys are not declared on ConfigValues (possible when
+        ui.input_fields.labels is customized) are ignored with a warning.
+        """
+        values = {key: field.text().strip()
+                  for key, field in self.string_fields.items()}
+        unknown = values.keys() - _CONFIG_VALUE_KEYS
+        if unknown:
+            self.logger.warning("Ignoring unrecognized configuration fields: %s",
+                                sorted(unknown))
+        return ConfigValues(**{key: value for key, value in values.items()
+                               if key in _CONFIG_VALUE_KEYS})
     
     def process_files(self):
         # Validate that we have all required inputs
@@ -550,7 +789,7 @@ class MainWindow(QMainWindow):
         string_values = self.get_string_values()
         
         # TODO: Use FileValidator.validate_string_inputs(string_values)
-        validation_errors = FileValidator.validate_string_inputs(string_values)
+        validation_errors = _validator().validate_string_inputs(string_values)
         if validation_errors:
             QMessageBox.warning(
                 self, 
@@ -560,9 +799,9 @@ class MainWindow(QMainWindow):
             return
         
         self.logger.info("Starting file processing...")  # TODO: Logger
-        self.logger.info(f"Input files: {[os.path.basename(f) for f in self.input_files]}")  # TODO: Logger
-        self.logger.info(f"Output path: {self.output_path}")  # TODO: Logger
-        self.logger.info(f"Configuration values: {string_values}")  # TODO: Logger
+        self.logger.info("Input files: %s", _LazyBasenames(self.input_files))  # TODO: Logger
+        self.logger.info("Output path: %s", self.output_path)  # TODO: Logger
+        self.logger.info("Configuration values: %s", string_values)  # TODO: Logger
         
         # Disable UI during processing
         self.process_btn.setEnabled(False)
@@ -570,16 +809,16 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.statusBar().showMessage("Processing files...")
         
-        # Start processing in background thread
-        self.processing_thread = ProcessingThread(
+        # Start processing on the shared worker pool
+        self.processing_worker = ProcessingWorker(
             self.input_files, 
             string_values, 
             self.output_path
         )
-        self.processing_thread.progress_updated.connect(self.progress_bar.setValue)
-        self.processing_thread.processing_complete.connect(self.on_processing_complete)
-        self.processing_thread.processing_error.connect(self.on_processing_error)
-        self.processing_thread.start()
+        self.processing_worker.signals.progress_updated.connect(self.progress_bar.setValue)
+        self.processing_worker.signals.processing_complete.connect(self.on_processing_complete)
+        self.processing_worker.signals.processing_error.connect(self.on_processing_error)
+        QThreadPool.globalInstance().start(self.processing_worker)
     
     def on_processing_complete(self, message):
         self.progress_bar.setVisible(False)
@@ -598,23 +837,23 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                # TODO: Use FileHandler.open_file(self.output_path) for cross-platform support
-                os.startfile(self.output_path)  # Windows only
-                # For cross-platform: subprocess.run(['open', self.output_path])  # macOS
-                # For cross-platform: subprocess.run(['xdg-open', self.output_path])  # Linux
-                self.logger.info(f"Opened output file: {self.output_path}")  # TODO: Logger
-            except Exception as e:
-                self.logger.error(f"Failed to open output file: {e}")  # TODO: Logger
-                QMessageBox.warning(self, "Cannot Open File", 
-                                  f"Could not open the output file:\n{str(e)}")
+            # TODO: Use FileHandler.open_file(self.output_path) for cross-platform support
+            self._open_task = OpenFileTask(self.output_path)
+            self._open_task.signals.error.connect(self._on_open_file_error)
+            QThreadPool.globalInstance().start(self._open_task)
+            self.logger.info("Opening output file: %s", self.output_path)  # TODO: Logger
+
+    def _on_open_file_error(self, message):
+        self.logger.error("Failed to open output file: %s", message)  # TODO: Logger
+        QMessageBox.warning(self, "Cannot Open File",
+                          f"Could not open the output file:\n{message}")
     
     def on_processing_error(self, error_message):
         self.progress_bar.setVisible(False)
         self.process_btn.setEnabled(True)
         self.statusBar().showMessage("Processing failed!")
         
-        self.logger.error(f"Processing failed: {error_message}")  # TODO: Logger
+        self.logger.error("Processing failed: %s", error_message)  # TODO: Logger
         QMessageBox.critical(self, "Processing Error", error_message)
 
 
@@ -624,17 +863,28 @@ def main():
     logger.info("Starting Excel File Processor application")
     
     app = QApplication(sys.argv)
-    
+
     # Set application properties
     app.setApplicationName("Excel File Processor")
     app.setApplicationVersion("1.0")
+
+    # Give the process-wide pixmap cache room for all application icons
+    QPixmapCache.setCacheLimit(10240)
+
+    # Cap the shared worker pool; processing, validation and file-open
+    # tasks all run here
+    QThreadPool.globalInstance().setMaxThreadCount(min(4, os.cpu_count() or 1))
+
+    # Warm the JIT cache in the background while the UI comes up, so the
+    # first click on Process finds the compiled helpers ready
+    threading.Thread(target=_prewarm_numba, daemon=True).start()
     
     # TODO: Initialize ResourceManager and load application-wide styles
     try:
-        resource_manager = ResourceManager()
+        resource_manager = _resource_manager
         
         # TODO: Load global stylesheet from resources/styles/app_global.qss
-        global_stylesheet = resource_manager.get_stylesheet("app_global.qss")
+        global_stylesheet = _qss("app_global.qss")
         if global_stylesheet:
             app.setStyleSheet(global_stylesheet)
             logger.info("Loaded global application stylesheet")
@@ -655,11 +905,11 @@ def main():
         
         logger.info("Main window displayed successfully")
         exit_code = app.exec_()
-        logger.info(f"Application exited with code: {exit_code}")
+        logger.info("Application exited with code: %d", exit_code)
         sys.exit(exit_code)
         
     except Exception as e:
-        logger.error(f"Critical error in main application: {e}")
+        logger.error("Critical error in main application: %s", e)
         QMessageBox.critical(None, "Critical Error", 
                            f"A critical error occurred:\n{str(e)}")
         sys.exit(1)
@@ -1,3 +1,5 @@
-from .validators import FileValidator
+# validators is intentionally not re-exported here: the GUI imports it
+# lazily at first use, and a package-level import would pull it (and its
+# dependencies) back onto the startup path.
 from .logger import setup_logger
 from .resource_manager import ResourceManager
\ No newline at end of file